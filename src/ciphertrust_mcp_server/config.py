@@ -26,6 +26,7 @@ class Settings(BaseSettings):
     ciphertrust_timeout: int = 30
     ciphertrust_domain: str = "root"
     ciphertrust_auth_domain: str = "root"
+    ciphertrust_read_cache_ttl: int = 0  # seconds; 0 disables caching of CTE get/list results
 
     # ksctl settings
     ksctl_download_url: Optional[str] = None
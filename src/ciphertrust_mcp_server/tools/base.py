@@ -2,7 +2,7 @@
 
 import json
 from abc import ABC, abstractmethod
-from typing import Any, TypeVar, Optional
+from typing import Any, Iterable, TypeVar, Optional
 
 from mcp.types import Tool
 from pydantic import BaseModel
@@ -49,7 +49,7 @@ class BaseTool(ABC):
         """Execute the tool with given parameters."""
         pass
 
-    def execute_with_domain(self, args: list[str], domain: Optional[str] = None, auth_domain: Optional[str] = None) -> dict[str, Any]:
+    def execute_with_domain(self, args: Iterable[str], domain: Optional[str] = None, auth_domain: Optional[str] = None) -> dict[str, Any]:
         """Execute ksctl command with optional domain override.
         
         This method allows executing commands in a specific domain without changing
@@ -57,15 +57,16 @@ class BaseTool(ABC):
         domain parameters.
         
         Args:
-            args: Base command arguments (e.g., ["users", "list"])
+            args: Base command arguments (e.g., ["users", "list"]); any iterable
+                of strings, including a generator, is accepted
             domain: The domain where the action/operation will be performed.
             auth_domain: The domain where the user is created. Defaults to 'root' if not specified.
             
         Returns:
             Command execution result
         """
-        # Clone args to avoid modifying the original
-        domain_args = args.copy()
+        # Materialize args exactly once; this also avoids modifying the original
+        domain_args = list(args)
         
         # Add domain parameters if specified
         if domain:
@@ -147,7 +148,6 @@ class BaseTool(ABC):
                 if isinstance(result["data"], str):
                     return result["data"]
                 else:
-                    import json
                     return json.dumps(result["data"], indent=2)
             else:
                 return result.get("stdout", "")
@@ -201,15 +201,24 @@ class BaseTool(ABC):
         return schema
 
     def to_mcp_tool(self) -> Tool:
-        """Convert to MCP Tool definition with universal compatibility."""
+        """Convert to MCP Tool definition with universal compatibility.
+        
+        Tool schemas are static, so the definition is built once per tool and
+        reused for every list_tools request.
+        """
+        cached: Optional[Tool] = getattr(self, "_mcp_tool", None)
+        if cached is not None:
+            return cached
+        
         # Get the original schema
         schema = self.get_schema()
         
         # Ensure compatibility with all MCP clients
         compatible_schema = self._ensure_schema_compatibility(schema)
         
-        return Tool(
+        self._mcp_tool = Tool(
             name=self.name,
             description=self.description,
             inputSchema=compatible_schema,
-        )
\ No newline at end of file
+        )
+        return self._mcp_tool
\ No newline at end of file
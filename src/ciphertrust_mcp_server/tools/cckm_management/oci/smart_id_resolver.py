@@ -377,7 +377,6 @@ class OCISmartIDResolver:
                 vaults = result["data"].get("resources", [])
             elif isinstance(result, str):
                 # Try to parse JSON string
-                import json
                 data = json.loads(result)
                 vaults = data.get("resources", [])
             else:
@@ -1,13 +1,149 @@
 """Base classes for CTE sub-tools"""
 
-from typing import Any, Dict, Optional
+import json
+import os
+import tempfile
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, Mapping, Optional, Sequence
 from abc import ABC, abstractmethod
 
+# Argument kinds understood by build_args
+REQUIRED = "required"        # "--flag value", value must be present
+VALUE = "value"              # "--flag value" when the value is truthy
+OPTIONAL = "optional"        # "--flag value" when the value is not None, stringified
+DEFAULT = "default"          # "--flag value", falling back to the spec default
+NOT_DEFAULT = "not_default"  # "--flag value" when the value differs from the spec default
+FLAG = "flag"                # "--flag" when the value is truthy
+NEGATED = "negated"          # "--no-flag" when the value (default True) is falsy
+TOGGLE = "toggle"            # "--flag" or "--no-flag" when the value is not None, see toggle()
+CONST = "const"              # "--flag" on every call
+JSON = "json"                # "--flag value" when truthy, else "--flag-file path", see json_or_file();
+                             # dict/list values are serialized compactly and an existing
+                             # file path given inline is passed as "--flag-file path"
+
+# Inline "--*-json" values whose UTF-8 encoding exceeds this many bytes are
+# passed to ksctl through the matching "--*-json-file" flag instead, keeping
+# argv well below the per-argument limit of exec (128 KiB on Linux)
+SPILL_JSON_BYTES = 64 * 1024
+
+
+def toggle(param: str, flag: str) -> tuple:
+    """Spec entry for a boolean that maps to "--flag" / "--no-flag".
+    
+    Both spellings are computed once here, indexed by the value's truthiness.
+    """
+    return (param, (f"--no-{flag[2:]}", flag), TOGGLE)
+
+
+def json_or_file(param: str, flag: str) -> tuple:
+    """Spec entry for inline JSON with a "<param>_file" / "--flag-file" fallback."""
+    return (param, flag, JSON, (f"{param}_file", f"{flag}-file"))
+
+
+def build_args(base: Sequence[str], kwargs: Dict[str, Any], spec: tuple) -> list[str]:
+    """Build ksctl arguments from a declarative spec.
+    
+    Each spec entry is ``(param, flag, kind)`` or ``(param, flag, kind, default)``
+    and is emitted in order after the base command.
+    """
+    args = list(base)
+    append, extend, get = args.append, args.extend, kwargs.get
+    for entry in spec:
+        param, flag, kind = entry[0], entry[1], entry[2]
+        if kind == REQUIRED:
+            extend((flag, kwargs[param]))
+        elif kind == DEFAULT:
+            value = get(param, entry[3])
+            extend((flag, value if isinstance(value, str) else f"{value}"))
+        elif kind == NOT_DEFAULT:
+            value = get(param, entry[3])
+            if value != entry[3]:
+                extend((flag, value))
+        elif kind == NEGATED:
+            if not get(param, True):
+                append(flag)
+        elif kind == CONST:
+            append(flag)
+        else:
+            # Remaining kinds read the value once and skip unset parameters
+            value = get(param)
+            if kind == VALUE:
+                if value:
+                    extend((flag, value))
+            elif kind == OPTIONAL:
+                if value is not None:
+                    extend((flag, value if isinstance(value, str) else f"{value}"))
+            elif kind == FLAG:
+                if value:
+                    append(flag)
+            elif kind == TOGGLE:
+                if value is not None:
+                    append(flag[bool(value)])
+            elif kind == JSON:
+                if not value:
+                    path = get(entry[3][0])
+                    if path:
+                        extend((entry[3][1], path))
+                elif not isinstance(value, str):
+                    extend((flag, json.dumps(value, separators=(",", ":"))))
+                elif value[0] not in "[{" and os.path.isfile(value):
+                    extend((entry[3][1], value))
+                else:
+                    extend((flag, value))
+    return args
+
 class CTESubTool(ABC):
     """Base class for CTE sub-tools"""
     
+    # action -> (base ksctl command, build_args spec) for operations that
+    # need no custom "_<action>" handler
+    commands: ClassVar[Mapping[str, tuple]] = MappingProxyType({})
+    
     def __init__(self, execute_with_domain_func):
         self.execute_with_domain = execute_with_domain_func
+        # Resolve each operation's handler once instead of per call
+        self.handlers = {}
+        for operation in self.get_operations():
+            if hasattr(self, f"_{operation}"):
+                self.handlers[operation] = getattr(self, f"_{operation}")
+            elif operation in self.commands:
+                self.handlers[operation] = self._command_handler(*self.commands[operation])
+    
+    def _command_handler(self, base: Sequence[str], spec: tuple):
+        """Create a handler that runs a table-driven ksctl command"""
+        def handler(kwargs):
+            return self.run_command(build_args(base, kwargs, spec), kwargs)
+        return handler
+    
+    def run_command(self, args: list[str], kwargs: Dict[str, Any]) -> Any:
+        """Run a ksctl command in the domain/auth_domain requested by the call.
+        
+        Returns the parsed JSON data when ksctl produced any, else raw stdout.
+        """
+        spilled: list[str] = []
+        try:
+            self._spill_large_json(args, spilled)
+            result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
+        finally:
+            for path in spilled:
+                os.unlink(path)
+        return result["data"] if "data" in result else result.get("stdout", "")
+    
+    @staticmethod
+    def _spill_large_json(args: list[str], spilled: list[str]) -> None:
+        """Move oversized inline JSON values into temporary files.
+        
+        Rewrites ``args`` in place to use the "-file" form of each such flag.
+        Every temporary file is recorded in ``spilled`` as soon as it exists,
+        so the caller can remove them all even if a later write fails.
+        """
+        for i in range(len(args) - 1):
+            flag, value = args[i], args[i + 1]
+            if flag.endswith("-json") and flag.startswith("--") and len(value.encode("utf-8")) > SPILL_JSON_BYTES:
+                with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False, encoding="utf-8") as temp_file:
+                    spilled.append(temp_file.name)
+                    temp_file.write(value)
+                args[i], args[i + 1] = f"{flag}-file", temp_file.name
     
     @abstractmethod
     def get_operations(self) -> list[str]:
@@ -23,8 +159,3 @@ class CTESubTool(ABC):
     def get_action_requirements(self) -> dict[str, Any]:
         """Return action requirements for this sub-tool's operations"""
         pass
-    
-    @abstractmethod
-    async def execute_operation(self, action: str, **kwargs: Any) -> Any:
-        """Execute the specified operation"""
-        pass
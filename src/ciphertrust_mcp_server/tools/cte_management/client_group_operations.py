@@ -1,7 +1,20 @@
 """Client group operations for CTE management."""
 
 from typing import Any
-from .base import CTESubTool
+from .base import CTESubTool, build_args, REQUIRED, VALUE, OPTIONAL, toggle
+from .constants import CTE_CLIENT_GROUPS
+
+# ksctl argument spec for client group modify, see build_args
+CLIENT_GROUP_MODIFY_ARGS = (
+    ("client_group_identifier", "--client-group-identifier", REQUIRED),
+    ("client_group_description", "--client-group-description", OPTIONAL),
+    ("client_group_password", "--client-group-password", VALUE),
+    ("password_creation_method", "--password-creation-method", VALUE),
+    toggle("comm_enabled", "--comm-enabled"),
+    toggle("cte_client_locked", "--cte-client-locked"),
+    toggle("system_locked", "--system-locked"),
+    ("cte_profile_identifier", "--cte-profile-identifier", VALUE),
+)
 
 class ClientGroupOperations(CTESubTool):
     """Handles all client group operations for CTE management."""
@@ -92,17 +105,9 @@ class ClientGroupOperations(CTESubTool):
             }
         }
     
-    async def execute_operation(self, action: str, **kwargs: Any) -> Any:
-        """Execute the specified client group operation."""
-        method_name = f"_{action}"
-        if hasattr(self, method_name):
-            return getattr(self, method_name)(**kwargs)
-        else:
-            return {"error": f"Unknown client group action: {action}"}
-    
-    def _client_group_create(self, **kwargs):
+    def _client_group_create(self, kwargs):
         """Create a CTE client group."""
-        args = ["cte", "client-groups", "create"]
+        args = list(CTE_CLIENT_GROUPS + ("create",))
         args.extend(["--client-group-name", kwargs["client_group_name"]])
         args.extend(["--cluster-type", kwargs.get("cluster_type", "NON-CLUSTER")])
 
@@ -117,12 +122,11 @@ class ClientGroupOperations(CTESubTool):
         if kwargs.get("cte_profile_identifier"):
             args.extend(["--cte-profile-identifier", kwargs["cte_profile_identifier"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _client_group_list(self, **kwargs):
+    def _client_group_list(self, kwargs):
         """List CTE client groups."""
-        args = ["cte", "client-groups", "list"]
+        args = list(CTE_CLIENT_GROUPS + ("list",))
         args.extend(["--limit", str(kwargs.get("limit", 10))])
         args.extend(["--skip", str(kwargs.get("skip", 0))])
         
@@ -131,44 +135,24 @@ class ClientGroupOperations(CTESubTool):
         if kwargs.get("cluster_type"):
             args.extend(["--cluster-type", kwargs["cluster_type"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _client_group_get(self, **kwargs):
+    def _client_group_get(self, kwargs):
         """Get a CTE client group."""
-        args = ["cte", "client-groups", "get"]
+        args = list(CTE_CLIENT_GROUPS + ("get",))
         args.extend(["--client-group-identifier", kwargs["client_group_identifier"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _client_group_delete(self, **kwargs):
+    def _client_group_delete(self, kwargs):
         """Delete a CTE client group."""
-        args = ["cte", "client-groups", "delete"]
+        args = list(CTE_CLIENT_GROUPS + ("delete",))
         args.extend(["--client-group-identifier", kwargs["client_group_identifier"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _client_group_modify(self, **kwargs):
+    def _client_group_modify(self, kwargs):
         """Modify a CTE client group."""
-        args = ["cte", "client-groups", "modify"]
-        args.extend(["--client-group-identifier", kwargs["client_group_identifier"]])
-        
-        if kwargs.get("client_group_description") is not None:
-            args.extend(["--client-group-description", kwargs["client_group_description"]])
-        if kwargs.get("client_group_password"):
-            args.extend(["--client-group-password", kwargs["client_group_password"]])
-        if kwargs.get("password_creation_method"):
-            args.extend(["--password-creation-method", kwargs["password_creation_method"]])
-        if kwargs.get("comm_enabled") is not None:
-            args.append("--comm-enabled" if kwargs["comm_enabled"] else "--no-comm-enabled")
-        if kwargs.get("cte_client_locked") is not None:
-            args.append("--cte-client-locked" if kwargs["cte_client_locked"] else "--no-cte-client-locked")
-        if kwargs.get("system_locked") is not None:
-            args.append("--system-locked" if kwargs["system_locked"] else "--no-system-locked")
-        if kwargs.get("cte_profile_identifier"):
-            args.extend(["--cte-profile-identifier", kwargs["cte_profile_identifier"]])
+        args = build_args(CTE_CLIENT_GROUPS + ("modify",), kwargs, CLIENT_GROUP_MODIFY_ARGS)
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
\ No newline at end of file
+        return self.run_command(args, kwargs)
\ No newline at end of file
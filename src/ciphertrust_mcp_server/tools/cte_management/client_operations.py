@@ -1,18 +1,91 @@
 """Client operations for CTE management."""
 
 from typing import Any
-from .base import CTESubTool
+from .base import CTESubTool, REQUIRED, VALUE, NOT_DEFAULT, FLAG, NEGATED, CONST, toggle
+from .constants import CTE_CLIENTS, PAGINATION
+
+# ksctl argument specs for each operation, see build_args
+CLIENT_IDENTIFIER = ("cte_client_identifier", "--cte-client-identifier", REQUIRED)
+GUARDPOINT_IDENTIFIER = ("guard_point_identifier", "--guard-point-identifier", REQUIRED)
+
+CLIENT_CREATE_ARGS = (
+    ("cte_client_name", "--cte-client-name", REQUIRED),
+    ("client_password", "--client-password", VALUE),
+    ("password_creation_method", "--password-creation-method", NOT_DEFAULT, "GENERATE"),
+    ("comm_enabled", "--comm-enabled", FLAG),
+    ("reg_allowed", "--reg-allowed", FLAG),
+    ("cte_client_type", "--cte-client-type", VALUE),
+    ("cte_profile_identifier", "--cte-profile-identifier", VALUE),
+    ("description", "--description", VALUE),
+)
+CLIENT_LIST_ARGS = PAGINATION + (
+    ("cte_client_name", "--cte-client-name", VALUE),
+    ("cte_client_type", "--cte-client-type", VALUE),
+)
+CLIENT_GET_ARGS = (CLIENT_IDENTIFIER,)
+CLIENT_DELETE_ARGS = (CLIENT_IDENTIFIER, (None, "--del-client", CONST))
+CLIENT_MODIFY_ARGS = (
+    CLIENT_IDENTIFIER,
+    ("client_password", "--client-password", VALUE),
+    ("password_creation_method", "--password-creation-method", VALUE),
+    toggle("comm_enabled", "--comm-enabled"),
+    toggle("reg_allowed", "--reg-allowed"),
+    toggle("cte_client_locked", "--cte-client-locked"),
+    toggle("system_locked", "--system-locked"),
+    ("cte_profile_identifier", "--cte-profile-identifier", VALUE),
+    ("host_name", "--host-name", VALUE),
+    toggle("client_mfa_enabled", "--client-mfa-enabled"),
+)
+
+GUARDPOINT_CREATE_ARGS = (
+    CLIENT_IDENTIFIER,
+    ("guard_path_list", "--guard-path-list", REQUIRED),
+    ("guard_point_type", "--guard-point-type", REQUIRED),
+    ("cte_policy_identifier", "--cte-policy-identifier", VALUE),
+    ("guard_enabled", "--no-guard-enabled", NEGATED),
+    ("auto_mount_enabled", "--auto-mount-enabled", FLAG),
+    ("cifs_enabled", "--cifs-enabled", FLAG),
+    ("early_access", "--early-access", FLAG),
+    ("preserve_sparse_regions", "--no-preserve-sparse-regions", NEGATED),
+    ("mfa_enabled", "--mfa-enabled", FLAG),
+    ("intelligent_protection", "--intelligent-protection", FLAG),
+    ("is_idt_capable_device", "--is-idt-capable-device", FLAG),
+)
+GUARDPOINT_LIST_ARGS = (CLIENT_IDENTIFIER,) + PAGINATION + (
+    ("cte_policy_identifier", "--cte-policy-identifier", VALUE),
+    ("sort", "--sort", VALUE),
+)
+GUARDPOINT_GET_ARGS = (CLIENT_IDENTIFIER, GUARDPOINT_IDENTIFIER)
+GUARDPOINT_MODIFY_ARGS = (
+    CLIENT_IDENTIFIER,
+    GUARDPOINT_IDENTIFIER,
+    toggle("guard_enabled", "--guard-enabled"),
+    toggle("mfa_enabled", "--mfa-enabled"),
+)
+GUARDPOINT_UNGUARD_ARGS = (CLIENT_IDENTIFIER, GUARDPOINT_IDENTIFIER)
+
+# action -> (base ksctl command, argument spec)
+COMMANDS = {
+    "client_create": (CTE_CLIENTS + ("create",), CLIENT_CREATE_ARGS),
+    "client_list": (CTE_CLIENTS + ("list",), CLIENT_LIST_ARGS),
+    "client_get": (CTE_CLIENTS + ("get",), CLIENT_GET_ARGS),
+    "client_delete": (CTE_CLIENTS + ("delete",), CLIENT_DELETE_ARGS),
+    "client_modify": (CTE_CLIENTS + ("modify",), CLIENT_MODIFY_ARGS),
+    "client_create_guardpoint": (CTE_CLIENTS + ("create-guardpoints",), GUARDPOINT_CREATE_ARGS),
+    "client_list_guardpoints": (CTE_CLIENTS + ("list-guardpoints",), GUARDPOINT_LIST_ARGS),
+    "client_get_guardpoint": (CTE_CLIENTS + ("get-guardpoints",), GUARDPOINT_GET_ARGS),
+    "client_modify_guardpoint": (CTE_CLIENTS + ("modify-guardpoints",), GUARDPOINT_MODIFY_ARGS),
+    "client_unguard_guardpoint": (CTE_CLIENTS + ("unguard-guardpoints",), GUARDPOINT_UNGUARD_ARGS),
+}
 
 class ClientOperations(CTESubTool):
     """Handles all client and guardpoint operations for CTE management."""
     
+    commands = COMMANDS
+    
     def get_operations(self) -> list[str]:
         """Return list of all client operations."""
-        return [
-            "client_create", "client_list", "client_get", "client_delete", "client_modify",
-            "client_create_guardpoint", "client_list_guardpoints", "client_get_guardpoint",
-            "client_modify_guardpoint", "client_unguard_guardpoint"
-        ]
+        return list(self.commands)
     
     def get_schema_properties(self) -> dict[str, Any]:
         """Return schema properties specific to client operations."""
@@ -225,173 +298,4 @@ class ClientOperations(CTESubTool):
                     "guard_point_identifier": "gp123"
                 }
             }
-        }
-    
-    async def execute_operation(self, action: str, **kwargs: Any) -> Any:
-        """Execute the specified client operation."""
-        method_name = f"_{action}"
-        if hasattr(self, method_name):
-            return getattr(self, method_name)(**kwargs)
-        else:
-            return {"error": f"Unknown client action: {action}"}
-    
-    # Client Operations
-    
-    def _client_create(self, **kwargs):
-        """Create a CTE client."""
-        args = ["cte", "clients", "create"]
-        args.extend(["--cte-client-name", kwargs["cte_client_name"]])
-        
-        if kwargs.get("client_password"):
-            args.extend(["--client-password", kwargs["client_password"]])
-        if kwargs.get("password_creation_method", "GENERATE") != "GENERATE":
-            args.extend(["--password-creation-method", kwargs["password_creation_method"]])
-        if kwargs.get("comm_enabled"):
-            args.append("--comm-enabled")
-        if kwargs.get("reg_allowed"):
-            args.append("--reg-allowed")
-        if kwargs.get("cte_client_type"):
-            args.extend(["--cte-client-type", kwargs["cte_client_type"]])
-        if kwargs.get("cte_profile_identifier"):
-            args.extend(["--cte-profile-identifier", kwargs["cte_profile_identifier"]])
-        if kwargs.get("description"):
-            args.extend(["--description", kwargs["description"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _client_list(self, **kwargs):
-        """List CTE clients."""
-        args = ["cte", "clients", "list"]
-        args.extend(["--limit", str(kwargs.get("limit", 10))])
-        args.extend(["--skip", str(kwargs.get("skip", 0))])
-        
-        if kwargs.get("cte_client_name"):
-            args.extend(["--cte-client-name", kwargs["cte_client_name"]])
-        if kwargs.get("cte_client_type"):
-            args.extend(["--cte-client-type", kwargs["cte_client_type"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _client_get(self, **kwargs):
-        """Get a CTE client."""
-        args = ["cte", "clients", "get"]
-        args.extend(["--cte-client-identifier", kwargs["cte_client_identifier"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _client_delete(self, **kwargs):
-        """Delete a CTE client."""
-        args = ["cte", "clients", "delete"]
-        args.extend(["--cte-client-identifier", kwargs["cte_client_identifier"]])
-        args.append("--del-client")
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _client_modify(self, **kwargs):
-        """Modify a CTE client."""
-        args = ["cte", "clients", "modify"]
-        args.extend(["--cte-client-identifier", kwargs["cte_client_identifier"]])
-        
-        if kwargs.get("client_password"):
-            args.extend(["--client-password", kwargs["client_password"]])
-        if kwargs.get("password_creation_method"):
-            args.extend(["--password-creation-method", kwargs["password_creation_method"]])
-        if kwargs.get("comm_enabled") is not None:
-            args.append("--comm-enabled" if kwargs["comm_enabled"] else "--no-comm-enabled")
-        if kwargs.get("reg_allowed") is not None:
-            args.append("--reg-allowed" if kwargs["reg_allowed"] else "--no-reg-allowed")
-        if kwargs.get("cte_client_locked") is not None:
-            args.append("--cte-client-locked" if kwargs["cte_client_locked"] else "--no-cte-client-locked")
-        if kwargs.get("system_locked") is not None:
-            args.append("--system-locked" if kwargs["system_locked"] else "--no-system-locked")
-        if kwargs.get("cte_profile_identifier"):
-            args.extend(["--cte-profile-identifier", kwargs["cte_profile_identifier"]])
-        if kwargs.get("host_name"):
-            args.extend(["--host-name", kwargs["host_name"]])
-        if kwargs.get("client_mfa_enabled") is not None:
-            args.append("--client-mfa-enabled" if kwargs["client_mfa_enabled"] else "--no-client-mfa-enabled")
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    # Guardpoint Operations
-    
-    def _client_create_guardpoint(self, **kwargs):
-        """Create a guardpoint on a CTE client."""
-        args = ["cte", "clients", "create-guardpoints"]
-        args.extend(["--cte-client-identifier", kwargs["cte_client_identifier"]])
-        args.extend(["--guard-path-list", kwargs["guard_path_list"]])
-        args.extend(["--guard-point-type", kwargs["guard_point_type"]])
-        
-        if kwargs.get("cte_policy_identifier"):
-            args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        if not kwargs.get("guard_enabled", True):
-            args.append("--no-guard-enabled")
-        if kwargs.get("auto_mount_enabled"):
-            args.append("--auto-mount-enabled")
-        if kwargs.get("cifs_enabled"):
-            args.append("--cifs-enabled")
-        if kwargs.get("early_access"):
-            args.append("--early-access")
-        if not kwargs.get("preserve_sparse_regions", True):
-            args.append("--no-preserve-sparse-regions")
-        if kwargs.get("mfa_enabled"):
-            args.append("--mfa-enabled")
-        if kwargs.get("intelligent_protection"):
-            args.append("--intelligent-protection")
-        if kwargs.get("is_idt_capable_device"):
-            args.append("--is-idt-capable-device")
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _client_list_guardpoints(self, **kwargs):
-        """List guardpoints on a CTE client."""
-        args = ["cte", "clients", "list-guardpoints"]
-        args.extend(["--cte-client-identifier", kwargs["cte_client_identifier"]])
-        args.extend(["--limit", str(kwargs.get("limit", 10))])
-        args.extend(["--skip", str(kwargs.get("skip", 0))])
-        
-        if kwargs.get("cte_policy_identifier"):
-            args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        if kwargs.get("sort"):
-            args.extend(["--sort", kwargs["sort"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _client_get_guardpoint(self, **kwargs):
-        """Get a guardpoint on a CTE client."""
-        args = ["cte", "clients", "get-guardpoints"]
-        args.extend(["--cte-client-identifier", kwargs["cte_client_identifier"]])
-        args.extend(["--guard-point-identifier", kwargs["guard_point_identifier"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _client_modify_guardpoint(self, **kwargs):
-        """Modify a guardpoint on a CTE client."""
-        args = ["cte", "clients", "modify-guardpoints"]
-        args.extend(["--cte-client-identifier", kwargs["cte_client_identifier"]])
-        args.extend(["--guard-point-identifier", kwargs["guard_point_identifier"]])
-        
-        if kwargs.get("guard_enabled") is not None:
-            args.append("--guard-enabled" if kwargs["guard_enabled"] else "--no-guard-enabled")
-        if kwargs.get("mfa_enabled") is not None:
-            args.append("--mfa-enabled" if kwargs["mfa_enabled"] else "--no-mfa-enabled")
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _client_unguard_guardpoint(self, **kwargs):
-        """Unguard a guardpoint from a CTE client."""
-        args = ["cte", "clients", "unguard-guardpoints"]
-        args.extend(["--cte-client-identifier", kwargs["cte_client_identifier"]])
-        args.extend(["--guard-point-identifier", kwargs["guard_point_identifier"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
\ No newline at end of file
+        }
\ No newline at end of file
@@ -1,5 +1,16 @@
 """Constants and examples for CTE management"""
 
+from .base import DEFAULT
+
+# ksctl command prefixes shared by the table-driven sub-tools
+CTE_CLIENTS = ("cte", "clients")
+CTE_CLIENT_GROUPS = ("cte", "client-groups")
+CTE_RESOURCE_SETS = ("cte", "resource-sets")
+CTE_POLICIES = ("cte", "policies")
+
+# build_args spec fragments shared across CTE operations
+PAGINATION = (("limit", "--limit", DEFAULT, 10), ("skip", "--skip", DEFAULT, 0))
+
 JSON_EXAMPLES = {
     "user_set": {
         "description": "User set structure for defining users and groups",
@@ -91,15 +91,7 @@ class CSIOperations(CTESubTool):
             }
         }
     
-    async def execute_operation(self, action: str, **kwargs: Any) -> Any:
-        """Execute the specified CSI operation."""
-        method_name = f"_{action}"
-        if hasattr(self, method_name):
-            return getattr(self, method_name)(**kwargs)
-        else:
-            return {"error": f"Unknown CSI action: {action}"}
-    
-    def _csi_storage_group_create(self, **kwargs):
+    def _csi_storage_group_create(self, kwargs):
         """Create a CSI StorageGroup."""
         args = ["cte", "csi", "k8s-storage-group", "create"]
         args.extend(["--storage-group-name", kwargs["storage_group_name"]])
@@ -111,10 +103,9 @@ class CSIOperations(CTESubTool):
         if kwargs.get("ctecsi_profile"):
             args.extend(["--ctecsi-profile", kwargs["ctecsi_profile"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _csi_storage_group_list(self, **kwargs):
+    def _csi_storage_group_list(self, kwargs):
         """List CSI StorageGroups."""
         args = ["cte", "csi", "k8s-storage-group", "list"]
         args.extend(["--limit", str(kwargs.get("limit", 10))])
@@ -129,26 +120,23 @@ class CSIOperations(CTESubTool):
         if kwargs.get("sort"):
             args.extend(["--sort", kwargs["sort"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _csi_storage_group_get(self, **kwargs):
+    def _csi_storage_group_get(self, kwargs):
         """Get a CSI StorageGroup."""
         args = ["cte", "csi", "k8s-storage-group", "get"]
         args.extend(["--storage-group-identifier", kwargs["storage_group_identifier"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _csi_storage_group_delete(self, **kwargs):
+    def _csi_storage_group_delete(self, kwargs):
         """Delete a CSI StorageGroup."""
         args = ["cte", "csi", "k8s-storage-group", "delete"]
         args.extend(["--storage-group-identifier", kwargs["storage_group_identifier"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _csi_storage_group_modify(self, **kwargs):
+    def _csi_storage_group_modify(self, kwargs):
         """Modify a CSI StorageGroup."""
         args = ["cte", "csi", "k8s-storage-group", "modify"]
         args.extend(["--storage-group-identifier", kwargs["storage_group_identifier"]])
@@ -158,5 +146,4 @@ class CSIOperations(CTESubTool):
         if kwargs.get("ctecsi_profile"):
             args.extend(["--ctecsi-profile", kwargs["ctecsi_profile"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
\ No newline at end of file
+        return self.run_command(args, kwargs)
\ No newline at end of file
@@ -1,8 +1,10 @@
+import asyncio
+import time
 from typing import Any, Optional, Dict, List
-from pydantic import BaseModel, Field
+from ...config import settings
 from ..base import BaseTool
 
-from .constants import JSON_EXAMPLES, COMMON_SCHEMA_PROPERTIES
+from .constants import COMMON_SCHEMA_PROPERTIES
 from .policy_operations import PolicyOperations
 from .user_set_operations import UserSetOperations
 from .process_set_operations import ProcessSetOperations
@@ -12,6 +14,9 @@ from .client_group_operations import ClientGroupOperations
 from .profile_operations import ProfileOperations
 from .csi_operations import CSIOperations
 
+# Upper bound on cached read results before the cache is reset
+READ_CACHE_MAX_ENTRIES = 256
+
 class CTEManagementTool(BaseTool):
     """Unified CTE Management Tool that delegates to specialized sub-tools.
     
@@ -19,6 +24,13 @@ class CTEManagementTool(BaseTool):
     organizing functionality into logical sub-tools for better maintainability.
     """
     
+    name = "cte_management"
+    description = (
+        "CTE (CipherTrust Transparent Encryption) management operations. "
+        "Supports policies, user sets, process sets, resource sets, clients, profiles, and CSI storage groups. "
+        "Each action has specific required and optional parameters - see action_requirements in schema for details."
+    )
+    
     def __init__(self):
         super().__init__()
         # Initialize all sub-tools with the execute_with_domain method
@@ -33,30 +45,42 @@ class CTEManagementTool(BaseTool):
             'csi': CSIOperations(self.execute_with_domain)
         }
         
-        # Build operation mapping
-        self.operation_mapping = {}
-        for tool_name, tool in self.sub_tools.items():
-            for operation in tool.get_operations():
-                self.operation_mapping[operation] = tool
-    
-    @property
-    def name(self) -> str:
-        return "cte_management"
-    
-    @property
-    def description(self) -> str:
-        return (
-            "CTE (CipherTrust Transparent Encryption) management operations. "
-            "Supports policies, user sets, process sets, resource sets, clients, profiles, and CSI storage groups. "
-            "Each action has specific required and optional parameters - see action_requirements in schema for details."
+        # Map every operation straight to its sub-tool handler
+        self.handlers = {}
+        for tool in self.sub_tools.values():
+            self.handlers.update(tool.handlers)
+        
+        # Results of get/list actions, cached for CIPHERTRUST_READ_CACHE_TTL seconds
+        self.read_actions = frozenset(
+            action for action in self.handlers
+            if {"get", "list"} & set(action.split("_"))
         )
+        self._read_cache: Dict[tuple, tuple[float, Any]] = {}
+        # Bumped by every completed write; a read only caches its result if
+        # no write finished while it was running
+        self._read_cache_generation = 0
+        
+        # The merged schema only depends on the static sub-tool definitions,
+        # so build it once instead of on every tool listing and call
+        self._schema: dict[str, Any] = self._build_schema()
+        
+        # Required parameter names per action, checked on every call
+        self.required_params = {
+            action: tuple(requirements.get("required", ()))
+            for action, requirements in self._schema["action_requirements"].items()
+        }
     
     def get_schema(self) -> dict[str, Any]:
+        """Return the complete schema built from all sub-tools"""
+        return self._schema
+    
+    def _build_schema(self) -> dict[str, Any]:
         """Build complete schema from all sub-tools"""
         # Collect all operations
         all_operations = []
         for tool in self.sub_tools.values():
             all_operations.extend(tool.get_operations())
+        all_operations.append("batch")
         
         # Start with common properties
         properties = {
@@ -65,6 +89,11 @@ class CTEManagementTool(BaseTool):
                 "enum": sorted(all_operations),
                 "description": "The CTE operation to perform. Choose based on what you want to accomplish."
             },
+            "operations": {
+                "type": "array",
+                "items": {"type": "object"},
+                "description": "List of CTE operations for the 'batch' action. Each item is an object with its own 'action' and that action's parameters. Top-level domain/auth_domain apply to items that do not set them."
+            },
             **COMMON_SCHEMA_PROPERTIES
         }
         
@@ -76,6 +105,17 @@ class CTEManagementTool(BaseTool):
         action_requirements = {}
         for tool in self.sub_tools.values():
             action_requirements.update(tool.get_action_requirements())
+        action_requirements["batch"] = {
+            "required": ["operations"],
+            "optional": ["domain", "auth_domain"],
+            "example": {
+                "action": "batch",
+                "operations": [
+                    {"action": "client_group_modify", "client_group_identifier": "WebServerGroup", "comm_enabled": True},
+                    {"action": "client_group_get", "client_group_identifier": "WebServerGroup"}
+                ]
+            }
+        }
         
         return {
             "type": "object",
@@ -87,16 +127,17 @@ class CTEManagementTool(BaseTool):
     
     async def execute(self, action: str, **kwargs: Any) -> Any:
         """Execute CTE operation by delegating to appropriate sub-tool"""
-        # Find the appropriate sub-tool for this action
-        if action not in self.operation_mapping:
-            return {"error": f"Unknown action: {action}"}
+        if action == "batch":
+            return await self._execute_batch(**kwargs)
         
-        sub_tool = self.operation_mapping[action]
+        # Find the sub-tool handler for this action
+        handler = self.handlers.get(action)
+        if handler is None:
+            return {"error": f"Unknown action: {action}"}
         
         # Validate action-specific requirements
         if not self._validate_action_params(action, kwargs):
-            schema = self.get_schema()
-            requirements = schema.get("action_requirements", {}).get(action, {})
+            requirements = self._schema["action_requirements"].get(action, {})
             required_params = requirements.get("required", [])
             example = requirements.get("example", {})
             return {
@@ -105,25 +146,84 @@ class CTEManagementTool(BaseTool):
                 "example": example
             }
         
-        # Delegate to the appropriate sub-tool
+        cache_key = None
+        is_write = False
+        generation = self._read_cache_generation
+        if settings.ciphertrust_read_cache_ttl > 0:
+            if action in self.read_actions:
+                cache_key = self._read_cache_key(action, kwargs)
+                if cache_key is not None:
+                    cached = self._read_cache.get(cache_key)
+                    if cached is not None and cached[0] > time.monotonic():
+                        return cached[1]
+            else:
+                is_write = True
+        
+        # Delegate to the appropriate sub-tool; handlers block on the ksctl
+        # subprocess, so run them off the event loop
         try:
-            return await sub_tool.execute_operation(action, **kwargs)
+            result = await asyncio.to_thread(handler, kwargs)
         except Exception as e:
             return {"error": f"Failed to execute {action}: {str(e)}"}
+        finally:
+            if is_write:
+                # Any write may change what a cached read would return; reads
+                # that overlapped it see the new generation and are not stored
+                self._read_cache_generation += 1
+                self._read_cache.clear()
+        
+        if cache_key is not None and generation == self._read_cache_generation:
+            if len(self._read_cache) >= READ_CACHE_MAX_ENTRIES:
+                self._read_cache.clear()
+            self._read_cache[cache_key] = (time.monotonic() + settings.ciphertrust_read_cache_ttl, result)
+        return result
+    
+    @staticmethod
+    def _read_cache_key(action: str, params: dict) -> Optional[tuple]:
+        """Build a hashable cache key for a read action, or None if params are unhashable"""
+        key = (action, tuple(sorted(params.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    async def _execute_batch(self, operations: Optional[List[Dict[str, Any]]] = None, **kwargs: Any) -> Any:
+        """Execute several CTE operations in one tool call, in order.
+        
+        Each operation is dispatched exactly like a standalone call, so a failing
+        item reports its own error without stopping the rest of the batch.
+        """
+        if not operations:
+            return {"error": "Missing required parameters for action 'batch'", "required": ["operations"]}
+        if not isinstance(operations, list):
+            return {"error": "Batch 'operations' must be a list of objects"}
+        
+        # Only the domain context is shared; every other parameter must be
+        # given per operation so a stray identifier never reaches the wrong item
+        inherited = {k: kwargs[k] for k in ("domain", "auth_domain") if kwargs.get(k) is not None}
+        results = []
+        for operation in operations:
+            if not isinstance(operation, dict):
+                results.append({"action": None, "result": {"error": "Each batch operation must be an object"}})
+                continue
+            params = {**inherited, **operation}
+            sub_action = params.pop("action", None)
+            if not sub_action or sub_action == "batch":
+                results.append({"action": sub_action, "result": {"error": "Each batch operation needs a non-batch 'action'"}})
+                continue
+            results.append({"action": sub_action, "result": await self.execute(sub_action, **params)})
+        return results
     
     def _validate_action_params(self, action: str, params: dict) -> bool:
         """Validate that required parameters are present for the action"""
-        schema = self.get_schema()
-        requirements = schema.get("action_requirements", {}).get(action, {})
-        required_params = requirements.get("required", [])
-        
         # Special case for user_set_create: allow either user_json or user_json_file
         if action == "user_set_create":
             if not (params.get("user_json") or params.get("user_json_file")):
                 return False
             return True
         
-        for param in required_params:
-            if param not in params or params[param] is None:
+        for param in self.required_params.get(action, ()):
+            if params.get(param) is None:
                 return False
         return True
\ No newline at end of file
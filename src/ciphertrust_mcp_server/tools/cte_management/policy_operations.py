@@ -1,26 +1,134 @@
 """Policy operations for CTE management."""
 
 from typing import Any
-from .base import CTESubTool
+from .base import CTESubTool, REQUIRED, VALUE, OPTIONAL, FLAG, toggle, json_or_file
+from .constants import CTE_POLICIES, PAGINATION
+
+# ksctl argument specs for each operation, see build_args
+POLICY_IDENTIFIER = ("cte_policy_identifier", "--cte-policy-identifier", REQUIRED)
+SECURITY_RULE_IDENTIFIER = ("security_rule_identifier", "--security-rule-identifier", REQUIRED)
+KEY_RULE_IDENTIFIER = ("key_rule_identifier", "--key-rule-identifier", REQUIRED)
+LDT_RULE_IDENTIFIER = ("ldt_rule_identifier", "--ldt-rule-identifier", REQUIRED)
+ORDER_NUMBER = ("order_number", "--order-number", OPTIONAL)
+RESOURCE_SET = ("resource_set_identifier", "--resource-set-identifier", VALUE)
+RULE_SETS = (
+    ("user_set_identifier", "--user-set-identifier", VALUE),
+    ("process_set_identifier", "--process-set-identifier", VALUE),
+    RESOURCE_SET,
+)
+
+POLICY_CREATE_ARGS = (
+    ("cte_policy_name", "--cte-policy-name", REQUIRED),
+    ("policy_type", "--policy-type", REQUIRED),
+    ("description", "--description", VALUE),
+    ("never_deny", "--never-deny", FLAG),
+    json_or_file("security_rules_json", "--security-rules-json"),
+    json_or_file("key_rules_json", "--key-rules-json"),
+    json_or_file("data_tx_rules_json", "--data-tx-rules-json"),
+    json_or_file("ldt_rules_json", "--ldt-rules-json"),
+    json_or_file("idt_rules_json", "--idt-rules-json"),
+    json_or_file("signature_rules_json", "--signature-rules-json"),
+    json_or_file("restrict_update_json", "--restrict-update-json"),
+)
+POLICY_LIST_ARGS = PAGINATION + (
+    ("cte_policy_name", "--cte-policy-name", VALUE),
+    ("policy_type", "--policy-type", VALUE),
+)
+POLICY_MODIFY_ARGS = (
+    POLICY_IDENTIFIER,
+    ("description", "--description", OPTIONAL),
+    toggle("never_deny", "--never-deny"),
+    json_or_file("restrict_update_json", "--restrict-update-json"),
+)
+
+SECURITY_RULE_ADD_ARGS = (
+    POLICY_IDENTIFIER,
+    ("effect", "--effect", REQUIRED),
+    ("action_type", "--action", VALUE),  # Note: CLI uses --action
+) + RULE_SETS + (
+    ("exclude_user_set", "--exclude-user-set", FLAG),
+    ("exclude_process_set", "--exclude-process-set", FLAG),
+    ("exclude_resource_set", "--exclude-resource-set", FLAG),
+)
+SECURITY_RULE_LIST_ARGS = (POLICY_IDENTIFIER,) + PAGINATION + (
+    ("action_type", "--action", VALUE),
+)
+SECURITY_RULE_MODIFY_ARGS = (
+    POLICY_IDENTIFIER,
+    SECURITY_RULE_IDENTIFIER,
+    ("effect", "--effect", VALUE),
+    ("action_type", "--action", VALUE),
+    ORDER_NUMBER,
+) + RULE_SETS + (
+    toggle("exclude_user_set", "--exclude-user-set"),
+    toggle("exclude_process_set", "--exclude-process-set"),
+    toggle("exclude_resource_set", "--exclude-resource-set"),
+)
+
+KEY_RULE_ADD_ARGS = (
+    POLICY_IDENTIFIER,
+    ("key_identifier", "--key-identifier", REQUIRED),
+    ("key_type", "--key-type", VALUE),
+    RESOURCE_SET,
+)
+KEY_RULE_MODIFY_ARGS = (
+    POLICY_IDENTIFIER,
+    KEY_RULE_IDENTIFIER,
+    ("key_identifier", "--key-identifier", VALUE),
+    ("key_type", "--key-type", VALUE),
+    ORDER_NUMBER,
+    RESOURCE_SET,
+)
+
+LDT_RULE_ADD_ARGS = (
+    POLICY_IDENTIFIER,
+    ("current_key_json_file", "--current-key-json-file", REQUIRED),
+    ("transform_key_json_file", "--transform-key-json-file", REQUIRED),
+    RESOURCE_SET,
+    ("is_exclusion_rule", "--is-exclusion-rule", FLAG),
+)
+LDT_RULE_MODIFY_ARGS = (
+    POLICY_IDENTIFIER,
+    LDT_RULE_IDENTIFIER,
+    ("current_key_json_file", "--current-key-json-file", VALUE),
+    ("transform_key_json_file", "--transform-key-json-file", VALUE),
+    ORDER_NUMBER,
+    RESOURCE_SET,
+    toggle("is_exclusion_rule", "--is-exclusion-rule"),
+)
+
+# action -> (base ksctl command, argument spec)
+COMMANDS = {
+    "policy_create": (CTE_POLICIES + ("create",), POLICY_CREATE_ARGS),
+    "policy_list": (CTE_POLICIES + ("list",), POLICY_LIST_ARGS),
+    "policy_get": (CTE_POLICIES + ("get",), (POLICY_IDENTIFIER,)),
+    "policy_delete": (CTE_POLICIES + ("delete",), (POLICY_IDENTIFIER,)),
+    "policy_modify": (CTE_POLICIES + ("modify",), POLICY_MODIFY_ARGS),
+    "policy_add_security_rule": (CTE_POLICIES + ("add-security-rules",), SECURITY_RULE_ADD_ARGS),
+    "policy_delete_security_rule": (CTE_POLICIES + ("delete-security-rules",), (POLICY_IDENTIFIER, SECURITY_RULE_IDENTIFIER)),
+    "policy_get_security_rule": (CTE_POLICIES + ("get-security-rules",), (POLICY_IDENTIFIER, SECURITY_RULE_IDENTIFIER)),
+    "policy_list_security_rules": (CTE_POLICIES + ("list-security-rules",), SECURITY_RULE_LIST_ARGS),
+    "policy_modify_security_rule": (CTE_POLICIES + ("modify-security-rules",), SECURITY_RULE_MODIFY_ARGS),
+    "policy_add_key_rule": (CTE_POLICIES + ("add-key-rules",), KEY_RULE_ADD_ARGS),
+    "policy_delete_key_rule": (CTE_POLICIES + ("delete-key-rules",), (POLICY_IDENTIFIER, KEY_RULE_IDENTIFIER)),
+    "policy_get_key_rule": (CTE_POLICIES + ("get-key-rules",), (POLICY_IDENTIFIER, KEY_RULE_IDENTIFIER)),
+    "policy_list_key_rules": (CTE_POLICIES + ("list-key-rules",), (POLICY_IDENTIFIER,) + PAGINATION),
+    "policy_modify_key_rule": (CTE_POLICIES + ("modify-key-rules",), KEY_RULE_MODIFY_ARGS),
+    "policy_add_ldt_rule": (CTE_POLICIES + ("add-ldt-rules",), LDT_RULE_ADD_ARGS),
+    "policy_delete_ldt_rule": (CTE_POLICIES + ("delete-ldt-rules",), (POLICY_IDENTIFIER, LDT_RULE_IDENTIFIER)),
+    "policy_get_ldt_rule": (CTE_POLICIES + ("get-ldt-rules",), (POLICY_IDENTIFIER, LDT_RULE_IDENTIFIER)),
+    "policy_list_ldt_rules": (CTE_POLICIES + ("list-ldt-rules",), (POLICY_IDENTIFIER,)),
+    "policy_modify_ldt_rule": (CTE_POLICIES + ("modify-ldt-rules",), LDT_RULE_MODIFY_ARGS),
+}
 
 class PolicyOperations(CTESubTool):
     """Handles all policy-related operations for CTE management."""
     
+    commands = COMMANDS
+    
     def get_operations(self) -> list[str]:
         """Return list of all policy operations."""
-        return [
-            # Core policy operations
-            "policy_create", "policy_list", "policy_get", "policy_delete", "policy_modify",
-            # Security rule operations
-            "policy_add_security_rule", "policy_delete_security_rule", "policy_get_security_rule",
-            "policy_list_security_rules", "policy_modify_security_rule",
-            # Key rule operations
-            "policy_add_key_rule", "policy_delete_key_rule", "policy_get_key_rule",
-            "policy_list_key_rules", "policy_modify_key_rule",
-            # LDT rule operations
-            "policy_add_ldt_rule", "policy_delete_ldt_rule", "policy_get_ldt_rule",
-            "policy_list_ldt_rules", "policy_modify_ldt_rule"
-        ]
+        return list(self.commands)
     
     def get_schema_properties(self) -> dict[str, Any]:
         """Return schema properties specific to policy operations."""
@@ -113,56 +221,56 @@ class PolicyOperations(CTESubTool):
             
             # Rule JSON parameters
             "security_rules_json": {
-                "type": "string",
-                "description": "Security rules in JSON format (for policy_create)"
+                "anyOf": [{"type": "string"}, {"type": "array"}, {"type": "object"}],
+                "description": "Security rules as a JSON string or as the rules array itself (for policy_create)"
             },
             "security_rules_json_file": {
                 "type": "string",
                 "description": "Path to JSON file containing security rules (for policy_create)"
             },
             "key_rules_json": {
-                "type": "string",
-                "description": "Key rules in JSON format (for policy_create)"
+                "anyOf": [{"type": "string"}, {"type": "array"}, {"type": "object"}],
+                "description": "Key rules as a JSON string or as the rules array itself (for policy_create)"
             },
             "key_rules_json_file": {
                 "type": "string",
                 "description": "Path to JSON file containing key rules (for policy_create)"
             },
             "ldt_rules_json": {
-                "type": "string",
-                "description": "LDT rules in JSON format (for policy_create)"
+                "anyOf": [{"type": "string"}, {"type": "array"}, {"type": "object"}],
+                "description": "LDT rules as a JSON string or as the rules array itself (for policy_create)"
             },
             "ldt_rules_json_file": {
                 "type": "string",
                 "description": "Path to JSON file containing LDT rules (for policy_create)"
             },
             "data_tx_rules_json": {
-                "type": "string",
-                "description": "Data transformation rules in JSON format (for policy_create)"
+                "anyOf": [{"type": "string"}, {"type": "array"}, {"type": "object"}],
+                "description": "Data transformation rules as a JSON string or as the rules array itself (for policy_create)"
             },
             "data_tx_rules_json_file": {
                 "type": "string",
                 "description": "Path to JSON file containing data transformation rules (for policy_create)"
             },
             "idt_rules_json": {
-                "type": "string",
-                "description": "IDT rules in JSON format (for policy_create)"
+                "anyOf": [{"type": "string"}, {"type": "array"}, {"type": "object"}],
+                "description": "IDT rules as a JSON string or as the rules array itself (for policy_create)"
             },
             "idt_rules_json_file": {
                 "type": "string",
                 "description": "Path to JSON file containing IDT rules (for policy_create)"
             },
             "signature_rules_json": {
-                "type": "string",
-                "description": "Signature rules in JSON format (for policy_create)"
+                "anyOf": [{"type": "string"}, {"type": "array"}, {"type": "object"}],
+                "description": "Signature rules as a JSON string or as the rules array itself (for policy_create)"
             },
             "signature_rules_json_file": {
                 "type": "string",
                 "description": "Path to JSON file containing signature rules (for policy_create)"
             },
             "restrict_update_json": {
-                "type": "string",
-                "description": "Restrict update parameters in JSON format"
+                "anyOf": [{"type": "string"}, {"type": "array"}, {"type": "object"}],
+                "description": "Restrict update parameters as a JSON string or as the object itself"
             },
             "restrict_update_json_file": {
                 "type": "string",
@@ -373,325 +481,4 @@ class PolicyOperations(CTESubTool):
                     "is_exclusion_rule": True
                 }
             }
-        }
-    
-    async def execute_operation(self, action: str, **kwargs: Any) -> Any:
-        """Execute the specified policy operation."""
-        method_name = f"_{action}"
-        if hasattr(self, method_name):
-            return getattr(self, method_name)(**kwargs)
-        else:
-            return {"error": f"Unknown policy action: {action}"}
-    
-    # Core Policy Operations
-    
-    def _policy_create(self, **kwargs):
-        """Create a CTE policy."""
-        args = ["cte", "policies", "create"]
-        
-        # Required parameters
-        args.extend(["--cte-policy-name", kwargs["cte_policy_name"]])
-        args.extend(["--policy-type", kwargs["policy_type"]])
-        
-        # Optional parameters
-        if kwargs.get("description"):
-            args.extend(["--description", kwargs["description"]])
-        if kwargs.get("never_deny", False):
-            args.append("--never-deny")
-        
-        # Rule JSON parameters
-        if kwargs.get("security_rules_json"):
-            args.extend(["--security-rules-json", kwargs["security_rules_json"]])
-        elif kwargs.get("security_rules_json_file"):
-            args.extend(["--security-rules-json-file", kwargs["security_rules_json_file"]])
-            
-        if kwargs.get("key_rules_json"):
-            args.extend(["--key-rules-json", kwargs["key_rules_json"]])
-        elif kwargs.get("key_rules_json_file"):
-            args.extend(["--key-rules-json-file", kwargs["key_rules_json_file"]])
-            
-        if kwargs.get("data_tx_rules_json"):
-            args.extend(["--data-tx-rules-json", kwargs["data_tx_rules_json"]])
-        elif kwargs.get("data_tx_rules_json_file"):
-            args.extend(["--data-tx-rules-json-file", kwargs["data_tx_rules_json_file"]])
-            
-        if kwargs.get("ldt_rules_json"):
-            args.extend(["--ldt-rules-json", kwargs["ldt_rules_json"]])
-        elif kwargs.get("ldt_rules_json_file"):
-            args.extend(["--ldt-rules-json-file", kwargs["ldt_rules_json_file"]])
-            
-        if kwargs.get("idt_rules_json"):
-            args.extend(["--idt-rules-json", kwargs["idt_rules_json"]])
-        elif kwargs.get("idt_rules_json_file"):
-            args.extend(["--idt-rules-json-file", kwargs["idt_rules_json_file"]])
-            
-        if kwargs.get("signature_rules_json"):
-            args.extend(["--signature-rules-json", kwargs["signature_rules_json"]])
-        elif kwargs.get("signature_rules_json_file"):
-            args.extend(["--signature-rules-json-file", kwargs["signature_rules_json_file"]])
-            
-        if kwargs.get("restrict_update_json"):
-            args.extend(["--restrict-update-json", kwargs["restrict_update_json"]])
-        elif kwargs.get("restrict_update_json_file"):
-            args.extend(["--restrict-update-json-file", kwargs["restrict_update_json_file"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _policy_list(self, **kwargs):
-        """List CTE policies."""
-        args = ["cte", "policies", "list"]
-        args.extend(["--limit", str(kwargs.get("limit", 10))])
-        args.extend(["--skip", str(kwargs.get("skip", 0))])
-        
-        if kwargs.get("cte_policy_name"):
-            args.extend(["--cte-policy-name", kwargs["cte_policy_name"]])
-        if kwargs.get("policy_type"):
-            args.extend(["--policy-type", kwargs["policy_type"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _policy_get(self, **kwargs):
-        """Get a specific CTE policy."""
-        args = ["cte", "policies", "get"]
-        args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _policy_delete(self, **kwargs):
-        """Delete a CTE policy."""
-        args = ["cte", "policies", "delete"]
-        args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _policy_modify(self, **kwargs):
-        """Modify a CTE policy."""
-        args = ["cte", "policies", "modify"]
-        args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        
-        if kwargs.get("description") is not None:
-            args.extend(["--description", kwargs["description"]])
-        if kwargs.get("never_deny") is not None:
-            args.append("--never-deny" if kwargs["never_deny"] else "--no-never-deny")
-        
-        if kwargs.get("restrict_update_json"):
-            args.extend(["--restrict-update-json", kwargs["restrict_update_json"]])
-        elif kwargs.get("restrict_update_json_file"):
-            args.extend(["--restrict-update-json-file", kwargs["restrict_update_json_file"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    # Security Rule Operations
-    
-    def _policy_add_security_rule(self, **kwargs):
-        """Add a security rule to a policy."""
-        args = ["cte", "policies", "add-security-rules"]
-        args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        args.extend(["--effect", kwargs["effect"]])
-        
-        if kwargs.get("action_type"):
-            args.extend(["--action", kwargs["action_type"]])  # Note: CLI uses --action
-        if kwargs.get("user_set_identifier"):
-            args.extend(["--user-set-identifier", kwargs["user_set_identifier"]])
-        if kwargs.get("process_set_identifier"):
-            args.extend(["--process-set-identifier", kwargs["process_set_identifier"]])
-        if kwargs.get("resource_set_identifier"):
-            args.extend(["--resource-set-identifier", kwargs["resource_set_identifier"]])
-        if kwargs.get("exclude_user_set"):
-            args.append("--exclude-user-set")
-        if kwargs.get("exclude_process_set"):
-            args.append("--exclude-process-set")
-        if kwargs.get("exclude_resource_set"):
-            args.append("--exclude-resource-set")
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _policy_delete_security_rule(self, **kwargs):
-        """Delete a security rule from a policy."""
-        args = ["cte", "policies", "delete-security-rules"]
-        args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        args.extend(["--security-rule-identifier", kwargs["security_rule_identifier"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _policy_get_security_rule(self, **kwargs):
-        """Get a security rule from a policy."""
-        args = ["cte", "policies", "get-security-rules"]
-        args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        args.extend(["--security-rule-identifier", kwargs["security_rule_identifier"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _policy_list_security_rules(self, **kwargs):
-        """List security rules in a policy."""
-        args = ["cte", "policies", "list-security-rules"]
-        args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        args.extend(["--limit", str(kwargs.get("limit", 10))])
-        args.extend(["--skip", str(kwargs.get("skip", 0))])
-        
-        if kwargs.get("action_type"):
-            args.extend(["--action", kwargs["action_type"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _policy_modify_security_rule(self, **kwargs):
-        """Modify a security rule in a policy."""
-        args = ["cte", "policies", "modify-security-rules"]
-        args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        args.extend(["--security-rule-identifier", kwargs["security_rule_identifier"]])
-        
-        if kwargs.get("effect"):
-            args.extend(["--effect", kwargs["effect"]])
-        if kwargs.get("action_type"):
-            args.extend(["--action", kwargs["action_type"]])
-        if kwargs.get("order_number") is not None:
-            args.extend(["--order-number", str(kwargs["order_number"])])
-        if kwargs.get("user_set_identifier"):
-            args.extend(["--user-set-identifier", kwargs["user_set_identifier"]])
-        if kwargs.get("process_set_identifier"):
-            args.extend(["--process-set-identifier", kwargs["process_set_identifier"]])
-        if kwargs.get("resource_set_identifier"):
-            args.extend(["--resource-set-identifier", kwargs["resource_set_identifier"]])
-        if kwargs.get("exclude_user_set") is not None:
-            args.append("--exclude-user-set" if kwargs["exclude_user_set"] else "--no-exclude-user-set")
-        if kwargs.get("exclude_process_set") is not None:
-            args.append("--exclude-process-set" if kwargs["exclude_process_set"] else "--no-exclude-process-set")
-        if kwargs.get("exclude_resource_set") is not None:
-            args.append("--exclude-resource-set" if kwargs["exclude_resource_set"] else "--no-exclude-resource-set")
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    # Key Rule Operations
-    
-    def _policy_add_key_rule(self, **kwargs):
-        """Add a key rule to a policy."""
-        args = ["cte", "policies", "add-key-rules"]
-        args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        args.extend(["--key-identifier", kwargs["key_identifier"]])
-        
-        if kwargs.get("key_type"):
-            args.extend(["--key-type", kwargs["key_type"]])
-        if kwargs.get("resource_set_identifier"):
-            args.extend(["--resource-set-identifier", kwargs["resource_set_identifier"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _policy_delete_key_rule(self, **kwargs):
-        """Delete a key rule from a policy."""
-        args = ["cte", "policies", "delete-key-rules"]
-        args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        args.extend(["--key-rule-identifier", kwargs["key_rule_identifier"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _policy_get_key_rule(self, **kwargs):
-        """Get a key rule from a policy."""
-        args = ["cte", "policies", "get-key-rules"]
-        args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        args.extend(["--key-rule-identifier", kwargs["key_rule_identifier"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _policy_list_key_rules(self, **kwargs):
-        """List key rules in a policy."""
-        args = ["cte", "policies", "list-key-rules"]
-        args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        args.extend(["--limit", str(kwargs.get("limit", 10))])
-        args.extend(["--skip", str(kwargs.get("skip", 0))])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _policy_modify_key_rule(self, **kwargs):
-        """Modify a key rule in a policy."""
-        args = ["cte", "policies", "modify-key-rules"]
-        args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        args.extend(["--key-rule-identifier", kwargs["key_rule_identifier"]])
-        
-        if kwargs.get("key_identifier"):
-            args.extend(["--key-identifier", kwargs["key_identifier"]])
-        if kwargs.get("key_type"):
-            args.extend(["--key-type", kwargs["key_type"]])
-        if kwargs.get("order_number") is not None:
-            args.extend(["--order-number", str(kwargs["order_number"])])
-        if kwargs.get("resource_set_identifier"):
-            args.extend(["--resource-set-identifier", kwargs["resource_set_identifier"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    # LDT Rule Operations
-    
-    def _policy_add_ldt_rule(self, **kwargs):
-        """Add an LDT rule to a policy."""
-        args = ["cte", "policies", "add-ldt-rules"]
-        args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        args.extend(["--current-key-json-file", kwargs["current_key_json_file"]])
-        args.extend(["--transform-key-json-file", kwargs["transform_key_json_file"]])
-        
-        if kwargs.get("resource_set_identifier"):
-            args.extend(["--resource-set-identifier", kwargs["resource_set_identifier"]])
-        if kwargs.get("is_exclusion_rule"):
-            args.append("--is-exclusion-rule")
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _policy_delete_ldt_rule(self, **kwargs):
-        """Delete an LDT rule from a policy."""
-        args = ["cte", "policies", "delete-ldt-rules"]
-        args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        args.extend(["--ldt-rule-identifier", kwargs["ldt_rule_identifier"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _policy_get_ldt_rule(self, **kwargs):
-        """Get an LDT rule from a policy."""
-        args = ["cte", "policies", "get-ldt-rules"]
-        args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        args.extend(["--ldt-rule-identifier", kwargs["ldt_rule_identifier"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _policy_list_ldt_rules(self, **kwargs):
-        """List LDT rules in a policy."""
-        args = ["cte", "policies", "list-ldt-rules"]
-        args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _policy_modify_ldt_rule(self, **kwargs):
-        """Modify an LDT rule in a policy."""
-        args = ["cte", "policies", "modify-ldt-rules"]
-        args.extend(["--cte-policy-identifier", kwargs["cte_policy_identifier"]])
-        args.extend(["--ldt-rule-identifier", kwargs["ldt_rule_identifier"]])
-        
-        if kwargs.get("current_key_json_file"):
-            args.extend(["--current-key-json-file", kwargs["current_key_json_file"]])
-        if kwargs.get("transform_key_json_file"):
-            args.extend(["--transform-key-json-file", kwargs["transform_key_json_file"]])
-        if kwargs.get("order_number") is not None:
-            args.extend(["--order-number", str(kwargs["order_number"])])
-        if kwargs.get("resource_set_identifier"):
-            args.extend(["--resource-set-identifier", kwargs["resource_set_identifier"]])
-        if kwargs.get("is_exclusion_rule") is not None:
-            args.append("--is-exclusion-rule" if kwargs["is_exclusion_rule"] else "--no-is-exclusion-rule")
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
\ No newline at end of file
+        }
\ No newline at end of file
@@ -144,15 +144,7 @@ class ProcessSetOperations(CTESubTool):
             }
         }
     
-    async def execute_operation(self, action: str, **kwargs: Any) -> Any:
-        """Execute the specified process set operation."""
-        method_name = f"_{action}"
-        if hasattr(self, method_name):
-            return getattr(self, method_name)(**kwargs)
-        else:
-            return {"error": f"Unknown process set action: {action}"}
-    
-    def _process_set_create(self, **kwargs):
+    def _process_set_create(self, kwargs):
         """Create a CTE process set."""
         args = ["cte", "process-sets", "create"]
         
@@ -163,10 +155,9 @@ class ProcessSetOperations(CTESubTool):
         else:
             return {"error": "Either process_json or process_json_file must be specified"}
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _process_set_list(self, **kwargs):
+    def _process_set_list(self, kwargs):
         """List CTE process sets."""
         args = ["cte", "process-sets", "list"]
         args.extend(["--limit", str(kwargs.get("limit", 10))])
@@ -175,26 +166,23 @@ class ProcessSetOperations(CTESubTool):
         if kwargs.get("process_set_name"):
             args.extend(["--process-set-name", kwargs["process_set_name"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _process_set_get(self, **kwargs):
+    def _process_set_get(self, kwargs):
         """Get a CTE process set."""
         args = ["cte", "process-sets", "get"]
         args.extend(["--process-set-identifier", kwargs["process_set_identifier"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _process_set_delete(self, **kwargs):
+    def _process_set_delete(self, kwargs):
         """Delete a CTE process set."""
         args = ["cte", "process-sets", "delete"]
         args.extend(["--process-set-identifier", kwargs["process_set_identifier"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _process_set_modify(self, **kwargs):
+    def _process_set_modify(self, kwargs):
         """Modify a CTE process set."""
         args = ["cte", "process-sets", "modify"]
         args.extend(["--process-set-identifier", kwargs["process_set_identifier"]])
@@ -206,38 +194,34 @@ class ProcessSetOperations(CTESubTool):
         else:
             return {"error": "Either process_json or process_json_file must be specified"}
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _process_set_add_processes(self, **kwargs):
+    def _process_set_add_processes(self, kwargs):
         """Add processes to a CTE process set."""
         args = ["cte", "process-sets", "add-processes"]
         args.extend(["--process-set-identifier", kwargs["process_set_identifier"]])
         args.extend(["--process-json-file", kwargs["process_json_file"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _process_set_delete_process(self, **kwargs):
+    def _process_set_delete_process(self, kwargs):
         """Delete a process from a CTE process set."""
         args = ["cte", "process-sets", "delete-process"]
         args.extend(["--process-set-identifier", kwargs["process_set_identifier"]])
         args.extend(["--process-index-list", kwargs["process_index_list"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _process_set_update_process(self, **kwargs):
+    def _process_set_update_process(self, kwargs):
         """Update a process in a CTE process set."""
         args = ["cte", "process-sets", "update-process"]
         args.extend(["--process-set-identifier", kwargs["process_set_identifier"]])
         args.extend(["--process-index", kwargs["process_index"]])
         args.extend(["--process-json-file", kwargs["process_json_file"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _process_set_list_processes(self, **kwargs):
+    def _process_set_list_processes(self, kwargs):
         """List processes in a CTE process set."""
         args = ["cte", "process-sets", "list-processes"]
         args.extend(["--process-set-identifier", kwargs["process_set_identifier"]])
@@ -247,15 +231,13 @@ class ProcessSetOperations(CTESubTool):
         if kwargs.get("search"):
             args.extend(["--search", kwargs["search"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _process_set_list_policies(self, **kwargs):
+    def _process_set_list_policies(self, kwargs):
         """List policies associated with a CTE process set."""
         args = ["cte", "process-sets", "list-policies"]
         args.extend(["--process-set-identifier", kwargs["process_set_identifier"]])
         args.extend(["--limit", str(kwargs.get("limit", 10))])
         args.extend(["--skip", str(kwargs.get("skip", 0))])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
\ No newline at end of file
+        return self.run_command(args, kwargs)
\ No newline at end of file
@@ -102,15 +102,7 @@ class ProfileOperations(CTESubTool):
             }
         }
     
-    async def execute_operation(self, action: str, **kwargs: Any) -> Any:
-        """Execute the specified profile operation."""
-        method_name = f"_{action}"
-        if hasattr(self, method_name):
-            return getattr(self, method_name)(**kwargs)
-        else:
-            return {"error": f"Unknown profile action: {action}"}
-    
-    def _profile_create(self, **kwargs):
+    def _profile_create(self, kwargs):
         """Create a CTE profile."""
         args = ["cte", "profiles", "create"]
         args.extend(["--cte-profile-name", kwargs["cte_profile_name"]])
@@ -130,10 +122,9 @@ class ProfileOperations(CTESubTool):
         if kwargs.get("server_response_rate") is not None:
             args.extend(["--server-response-rate", str(kwargs["server_response_rate"])])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _profile_list(self, **kwargs):
+    def _profile_list(self, kwargs):
         """List CTE profiles."""
         args = ["cte", "profiles", "list"]
         args.extend(["--limit", str(kwargs.get("limit", 10))])
@@ -142,10 +133,9 @@ class ProfileOperations(CTESubTool):
         if kwargs.get("cte_profile_name"):
             args.extend(["--cte-profile-name", kwargs["cte_profile_name"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _profile_get(self, **kwargs):
+    def _profile_get(self, kwargs):
         """Get a CTE profile."""
         args = ["cte", "profiles", "get"]
         args.extend(["--cte-profile-identifier", kwargs["cte_profile_identifier"]])
@@ -153,10 +143,9 @@ class ProfileOperations(CTESubTool):
         if kwargs.get("cte_profile_name"):
             args.extend(["--cte-profile-name", kwargs["cte_profile_name"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _profile_delete(self, **kwargs):
+    def _profile_delete(self, kwargs):
         """Delete a CTE profile."""
         args = ["cte", "profiles", "delete"]
         args.extend(["--cte-profile-identifier", kwargs["cte_profile_identifier"]])
@@ -164,10 +153,9 @@ class ProfileOperations(CTESubTool):
         if kwargs.get("cte_profile_name"):
             args.extend(["--cte-profile-name", kwargs["cte_profile_name"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _profile_modify(self, **kwargs):
+    def _profile_modify(self, kwargs):
         """Modify a CTE profile."""
         args = ["cte", "profiles", "modify"]
         args.extend(["--cte-profile-identifier", kwargs["cte_profile_identifier"]])
@@ -187,5 +175,4 @@ class ProfileOperations(CTESubTool):
         if kwargs.get("server_response_rate") is not None:
             args.extend(["--server-response-rate", str(kwargs["server_response_rate"])])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
\ No newline at end of file
+        return self.run_command(args, kwargs)
\ No newline at end of file
@@ -1,11 +1,44 @@
 """Resource set operations for CTE management."""
 
 from typing import Any
-from .base import CTESubTool
+from .base import CTESubTool, REQUIRED, VALUE
+from .constants import CTE_RESOURCE_SETS, PAGINATION
+
+# ksctl argument specs for each operation, see build_args
+RESOURCE_SET_IDENTIFIER = ("resource_set_identifier", "--resource-set-identifier", REQUIRED)
+
+# action -> (base ksctl command, argument spec); create and modify keep
+# custom handlers because they take either inline or file JSON
+COMMANDS = {
+    "resource_set_list": (CTE_RESOURCE_SETS + ("list",), PAGINATION + (
+        ("resource_set_name", "--resource-set-name", VALUE),
+    )),
+    "resource_set_get": (CTE_RESOURCE_SETS + ("get",), (RESOURCE_SET_IDENTIFIER,)),
+    "resource_set_delete": (CTE_RESOURCE_SETS + ("delete",), (RESOURCE_SET_IDENTIFIER,)),
+    "resource_set_add_resources": (CTE_RESOURCE_SETS + ("add-resources",), (
+        RESOURCE_SET_IDENTIFIER,
+        ("resource_json_file", "--resource-json-file", REQUIRED),
+    )),
+    "resource_set_delete_resource": (CTE_RESOURCE_SETS + ("delete-resource",), (
+        RESOURCE_SET_IDENTIFIER,
+        ("resource_index_list", "--resource-index-list", REQUIRED),
+    )),
+    "resource_set_update_resource": (CTE_RESOURCE_SETS + ("update-resource",), (
+        RESOURCE_SET_IDENTIFIER,
+        ("resource_index", "--resource-index", REQUIRED),
+        ("resource_json_file", "--resource-json-file", REQUIRED),
+    )),
+    "resource_set_list_resources": (CTE_RESOURCE_SETS + ("list-resources",), (RESOURCE_SET_IDENTIFIER,) + PAGINATION + (
+        ("search", "--search", VALUE),
+    )),
+    "resource_set_list_policies": (CTE_RESOURCE_SETS + ("list-policies",), (RESOURCE_SET_IDENTIFIER,) + PAGINATION),
+}
 
 class ResourceSetOperations(CTESubTool):
     """Handles all resource set operations for CTE management."""
     
+    commands = COMMANDS
+    
     def get_operations(self) -> list[str]:
         """Return list of all resource set operations."""
         return [
@@ -145,17 +178,9 @@ class ResourceSetOperations(CTESubTool):
             }
         }
     
-    async def execute_operation(self, action: str, **kwargs: Any) -> Any:
-        """Execute the specified resource set operation."""
-        method_name = f"_{action}"
-        if hasattr(self, method_name):
-            return getattr(self, method_name)(**kwargs)
-        else:
-            return {"error": f"Unknown resource set action: {action}"}
-    
-    def _resource_set_create(self, **kwargs):
+    def _resource_set_create(self, kwargs):
         """Create a CTE resource set."""
-        args = ["cte", "resource-sets", "create"]
+        args = list(CTE_RESOURCE_SETS + ("create",))
         
         if kwargs.get("resource_json"):
             args.extend(["--resource-json", kwargs["resource_json"]])
@@ -164,40 +189,11 @@ class ResourceSetOperations(CTESubTool):
         else:
             return {"error": "Either resource_json or resource_json_file must be specified"}
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _resource_set_list(self, **kwargs):
-        """List CTE resource sets."""
-        args = ["cte", "resource-sets", "list"]
-        args.extend(["--limit", str(kwargs.get("limit", 10))])
-        args.extend(["--skip", str(kwargs.get("skip", 0))])
-        
-        if kwargs.get("resource_set_name"):
-            args.extend(["--resource-set-name", kwargs["resource_set_name"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _resource_set_get(self, **kwargs):
-        """Get a CTE resource set."""
-        args = ["cte", "resource-sets", "get"]
-        args.extend(["--resource-set-identifier", kwargs["resource_set_identifier"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _resource_set_delete(self, **kwargs):
-        """Delete a CTE resource set."""
-        args = ["cte", "resource-sets", "delete"]
-        args.extend(["--resource-set-identifier", kwargs["resource_set_identifier"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _resource_set_modify(self, **kwargs):
+    def _resource_set_modify(self, kwargs):
         """Modify a CTE resource set."""
-        args = ["cte", "resource-sets", "modify"]
+        args = list(CTE_RESOURCE_SETS + ("modify",))
         args.extend(["--resource-set-identifier", kwargs["resource_set_identifier"]])
         
         if kwargs.get("resource_json"):
@@ -207,56 +203,4 @@ class ResourceSetOperations(CTESubTool):
         else:
             return {"error": "Either resource_json or resource_json_file must be specified"}
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _resource_set_add_resources(self, **kwargs):
-        """Add resources to a CTE resource set."""
-        args = ["cte", "resource-sets", "add-resources"]
-        args.extend(["--resource-set-identifier", kwargs["resource_set_identifier"]])
-        args.extend(["--resource-json-file", kwargs["resource_json_file"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _resource_set_delete_resource(self, **kwargs):
-        """Delete a resource from a CTE resource set."""
-        args = ["cte", "resource-sets", "delete-resource"]
-        args.extend(["--resource-set-identifier", kwargs["resource_set_identifier"]])
-        args.extend(["--resource-index-list", kwargs["resource_index_list"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _resource_set_update_resource(self, **kwargs):
-        """Update a resource in a CTE resource set."""
-        args = ["cte", "resource-sets", "update-resource"]
-        args.extend(["--resource-set-identifier", kwargs["resource_set_identifier"]])
-        args.extend(["--resource-index", kwargs["resource_index"]])
-        args.extend(["--resource-json-file", kwargs["resource_json_file"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _resource_set_list_resources(self, **kwargs):
-        """List resources in a CTE resource set."""
-        args = ["cte", "resource-sets", "list-resources"]
-        args.extend(["--resource-set-identifier", kwargs["resource_set_identifier"]])
-        args.extend(["--limit", str(kwargs.get("limit", 10))])
-        args.extend(["--skip", str(kwargs.get("skip", 0))])
-        
-        if kwargs.get("search"):
-            args.extend(["--search", kwargs["search"]])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
-    
-    def _resource_set_list_policies(self, **kwargs):
-        """List policies associated with a CTE resource set."""
-        args = ["cte", "resource-sets", "list-policies"]
-        args.extend(["--resource-set-identifier", kwargs["resource_set_identifier"]])
-        args.extend(["--limit", str(kwargs.get("limit", 10))])
-        args.extend(["--skip", str(kwargs.get("skip", 0))])
-        
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
\ No newline at end of file
+        return self.run_command(args, kwargs)
\ No newline at end of file
@@ -146,15 +146,7 @@ class UserSetOperations(CTESubTool):
             }
         }
     
-    async def execute_operation(self, action: str, **kwargs: Any) -> Any:
-        """Execute the specified user set operation."""
-        method_name = f"_{action}"
-        if hasattr(self, method_name):
-            return getattr(self, method_name)(**kwargs)
-        else:
-            return {"error": f"Unknown user set action: {action}"}
-    
-    def _user_set_create(self, **kwargs):
+    def _user_set_create(self, kwargs):
         """Create a CTE user set."""
         args = ["cte", "user-sets", "create"]
         
@@ -165,10 +157,9 @@ class UserSetOperations(CTESubTool):
         else:
             return {"error": "Either user_json or user_json_file must be specified"}
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _user_set_list(self, **kwargs):
+    def _user_set_list(self, kwargs):
         """List CTE user sets."""
         args = ["cte", "user-sets", "list"]
         args.extend(["--limit", str(kwargs.get("limit", 10))])
@@ -177,26 +168,23 @@ class UserSetOperations(CTESubTool):
         if kwargs.get("user_set_name"):
             args.extend(["--user-set-name", kwargs["user_set_name"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _user_set_get(self, **kwargs):
+    def _user_set_get(self, kwargs):
         """Get a CTE user set."""
         args = ["cte", "user-sets", "get"]
         args.extend(["--user-set-identifier", kwargs["user_set_identifier"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _user_set_delete(self, **kwargs):
+    def _user_set_delete(self, kwargs):
         """Delete a CTE user set."""
         args = ["cte", "user-sets", "delete"]
         args.extend(["--user-set-identifier", kwargs["user_set_identifier"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _user_set_modify(self, **kwargs):
+    def _user_set_modify(self, kwargs):
         """Modify a CTE user set."""
         args = ["cte", "user-sets", "modify"]
         args.extend(["--user-set-identifier", kwargs["user_set_identifier"]])
@@ -208,38 +196,34 @@ class UserSetOperations(CTESubTool):
         else:
             return {"error": "Either user_json or user_json_file must be specified"}
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _user_set_add_users(self, **kwargs):
+    def _user_set_add_users(self, kwargs):
         """Add users to a CTE user set."""
         args = ["cte", "user-sets", "add-users"]
         args.extend(["--user-set-identifier", kwargs["user_set_identifier"]])
         args.extend(["--user-json-file", kwargs["user_json_file"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _user_set_delete_user(self, **kwargs):
+    def _user_set_delete_user(self, kwargs):
         """Delete a user from a CTE user set."""
         args = ["cte", "user-sets", "delete-user"]
         args.extend(["--user-set-identifier", kwargs["user_set_identifier"]])
         args.extend(["--user-index-list", kwargs["user_index_list"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _user_set_update_user(self, **kwargs):
+    def _user_set_update_user(self, kwargs):
         """Update a user in a CTE user set."""
         args = ["cte", "user-sets", "update-user"]
         args.extend(["--user-set-identifier", kwargs["user_set_identifier"]])
         args.extend(["--user-index", kwargs["user_index"]])
         args.extend(["--user-json-file", kwargs["user_json_file"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _user_set_list_users(self, **kwargs):
+    def _user_set_list_users(self, kwargs):
         """List users in a CTE user set."""
         args = ["cte", "user-sets", "list-users"]
         args.extend(["--user-set-identifier", kwargs["user_set_identifier"]])
@@ -249,15 +233,13 @@ class UserSetOperations(CTESubTool):
         if kwargs.get("search"):
             args.extend(["--search", kwargs["search"]])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
+        return self.run_command(args, kwargs)
     
-    def _user_set_list_policies(self, **kwargs):
+    def _user_set_list_policies(self, kwargs):
         """List policies associated with a CTE user set."""
         args = ["cte", "user-sets", "list-policies"]
         args.extend(["--user-set-identifier", kwargs["user_set_identifier"]])
         args.extend(["--limit", str(kwargs.get("limit", 10))])
         args.extend(["--skip", str(kwargs.get("skip", 0))])
         
-        result = self.execute_with_domain(args, kwargs.get("domain"), kwargs.get("auth_domain"))
-        return result.get("data", result.get("stdout", ""))
\ No newline at end of file
+        return self.run_command(args, kwargs)
\ No newline at end of file
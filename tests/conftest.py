@@ -0,0 +1,70 @@
+"""
+Shared pytest setup for unit tests that import the server package
+
+Settings are read and every tool is constructed at import time, so a
+placeholder URL and ksctl binary are provided just for that import. They
+are removed again afterwards so the environment-driven integration tests
+still skip when no real CipherTrust Manager is configured.
+"""
+
+import os
+import shutil
+import tempfile
+from itertools import pairwise
+from pathlib import Path
+
+import pytest
+
+_placeholder_dir = Path(tempfile.mkdtemp(prefix="ciphertrust-mcp-tests-"))
+(_placeholder_dir / "ksctl").touch()
+
+_import_env = {
+    "CIPHERTRUST_URL": "https://ciphertrust.test",
+    "KSCTL_PATH": str(_placeholder_dir / "ksctl"),
+}
+_added = [key for key in _import_env if key not in os.environ]
+for key in _added:
+    os.environ[key] = _import_env[key]
+
+try:
+    import ciphertrust_mcp_server.tools  # noqa: F401  (builds settings and all tools)
+    from ciphertrust_mcp_server.tools.cte_management.main import CTEManagementTool
+finally:
+    for key in _added:
+        del os.environ[key]
+    # The ksctl manager only checks for the binary when it is created
+    shutil.rmtree(_placeholder_dir, ignore_errors=True)
+
+
+class RecordingKsctl:
+    """Stands in for ksctl: records each call and answers with empty data
+
+    Spilled JSON files only exist during the call, so their contents are
+    captured then.
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.files = {}
+
+    def __call__(self, args, domain=None, auth_domain=None):
+        args = list(args)
+        self.calls.append((args, domain, auth_domain))
+        for flag, value in pairwise(args):
+            if flag.endswith("-json-file") and Path(value).is_file():
+                self.files[value] = Path(value).read_text(encoding="utf-8")
+        return {"data": {"ok": True}}
+
+
+@pytest.fixture
+def ksctl():
+    return RecordingKsctl()
+
+
+@pytest.fixture
+def cte_tool(ksctl):
+    """CTE management tool whose sub-tools run ksctl through the recording fake"""
+    tool = CTEManagementTool()
+    for sub_tool in tool.sub_tools.values():
+        sub_tool.execute_with_domain = ksctl
+    return tool
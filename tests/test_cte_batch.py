@@ -0,0 +1,66 @@
+"""
+Tests for the CTE management tool's batch action
+
+ksctl is replaced by the recording fake from conftest, so no subprocess is run.
+"""
+
+import pytest
+
+
+class TestBatch:
+    """The batch action runs each operation like a standalone call"""
+
+    @pytest.mark.asyncio
+    async def test_operations_run_in_order(self, cte_tool, ksctl):
+        results = await cte_tool.execute(action="batch", operations=[
+            {"action": "client_group_modify", "client_group_identifier": "G1",
+             "comm_enabled": False},
+            {"action": "client_group_get", "client_group_identifier": "G1"},
+        ])
+        assert [r["action"] for r in results] == ["client_group_modify", "client_group_get"]
+        assert [call[0][2:] for call in ksctl.calls] == [
+            ["modify", "--client-group-identifier", "G1", "--no-comm-enabled"],
+            ["get", "--client-group-identifier", "G1"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_top_level_domain_is_a_default(self, cte_tool, ksctl):
+        await cte_tool.execute(action="batch", domain="d1", auth_domain="a1", operations=[
+            {"action": "client_get", "cte_client_identifier": "C1"},
+            {"action": "client_get", "cte_client_identifier": "C2", "domain": "d2"},
+        ])
+        assert [call[1:] for call in ksctl.calls] == [("d1", "a1"), ("d2", "a1")]
+
+    @pytest.mark.asyncio
+    async def test_other_top_level_params_are_not_inherited(self, cte_tool, ksctl):
+        results = await cte_tool.execute(
+            action="batch",
+            cte_client_identifier="C1",
+            operations=[{"action": "client_delete"}],
+        )
+        assert "error" in results[0]["result"]
+        assert ksctl.calls == []
+
+    @pytest.mark.asyncio
+    async def test_operations_must_be_a_list(self, cte_tool, ksctl):
+        result = await cte_tool.execute(action="batch", operations="notalist")
+        assert result == {"error": "Batch 'operations' must be a list of objects"}
+        assert ksctl.calls == []
+
+    @pytest.mark.asyncio
+    async def test_operations_are_required(self, cte_tool, ksctl):
+        result = await cte_tool.execute(action="batch", operations=[])
+        assert result["required"] == ["operations"]
+        assert ksctl.calls == []
+
+    @pytest.mark.asyncio
+    async def test_invalid_items_fail_individually(self, cte_tool, ksctl):
+        results = await cte_tool.execute(action="batch", operations=[
+            "junk",
+            {"action": "batch", "operations": []},
+            {"cte_client_identifier": "C1"},
+            {"action": "client_get"},
+            {"action": "client_get", "cte_client_identifier": "C1"},
+        ])
+        assert [("error" in r["result"]) for r in results] == [True, True, True, True, False]
+        assert len(ksctl.calls) == 1
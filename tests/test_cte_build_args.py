@@ -0,0 +1,119 @@
+"""
+Tests for the ksctl argument building behind the CTE management tool
+
+cte_argv_cases.json pins the exact ksctl arguments every CTE action produced
+before the sub-tools moved to declarative build_args specs, for a minimal
+call and for calls setting every optional parameter. ksctl itself is
+replaced by the recording fake from conftest, so no subprocess is run.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ciphertrust_mcp_server.tools.cte_management.base import (
+    CONST,
+    DEFAULT,
+    FLAG,
+    NEGATED,
+    NOT_DEFAULT,
+    OPTIONAL,
+    REQUIRED,
+    VALUE,
+    build_args,
+    json_or_file,
+    toggle,
+)
+
+ARGV_CASES = json.loads(Path(__file__).with_name("cte_argv_cases.json").read_text())
+
+
+class TestBuildArgsKinds:
+    """Each build_args argument kind in isolation"""
+
+    @pytest.mark.parametrize(
+        ("entry", "kwargs", "expected"),
+        [
+            (("name", "--name", REQUIRED), {"name": "n"}, ["--name", "n"]),
+            (("name", "--name", VALUE), {"name": "n"}, ["--name", "n"]),
+            (("name", "--name", VALUE), {"name": ""}, []),
+            (("name", "--name", VALUE), {}, []),
+            (("name", "--name", OPTIONAL), {"name": ""}, ["--name", ""]),
+            (("order", "--order", OPTIONAL), {"order": 0}, ["--order", "0"]),
+            (("name", "--name", OPTIONAL), {"name": None}, []),
+            (("limit", "--limit", DEFAULT, 10), {}, ["--limit", "10"]),
+            (("limit", "--limit", DEFAULT, 10), {"limit": 5}, ["--limit", "5"]),
+            (("method", "--method", NOT_DEFAULT, "GENERATE"), {}, []),
+            (("method", "--method", NOT_DEFAULT, "GENERATE"), {"method": "GENERATE"}, []),
+            (
+                ("method", "--method", NOT_DEFAULT, "GENERATE"),
+                {"method": "MANUAL"},
+                ["--method", "MANUAL"],
+            ),
+            (("enabled", "--enabled", FLAG), {"enabled": True}, ["--enabled"]),
+            (("enabled", "--enabled", FLAG), {"enabled": False}, []),
+            (("guard", "--no-guard", NEGATED), {}, []),
+            (("guard", "--no-guard", NEGATED), {"guard": True}, []),
+            (("guard", "--no-guard", NEGATED), {"guard": False}, ["--no-guard"]),
+            (toggle("locked", "--locked"), {}, []),
+            (toggle("locked", "--locked"), {"locked": True}, ["--locked"]),
+            (toggle("locked", "--locked"), {"locked": False}, ["--no-locked"]),
+            ((None, "--force", CONST), {}, ["--force"]),
+            (json_or_file("rules_json", "--rules-json"), {}, []),
+            (
+                json_or_file("rules_json", "--rules-json"),
+                {"rules_json": "[]"},
+                ["--rules-json", "[]"],
+            ),
+            (
+                json_or_file("rules_json", "--rules-json"),
+                {"rules_json_file": "/r.json"},
+                ["--rules-json-file", "/r.json"],
+            ),
+            (
+                json_or_file("rules_json", "--rules-json"),
+                {"rules_json": "[1]", "rules_json_file": "/r.json"},
+                ["--rules-json", "[1]"],
+            ),
+            (
+                json_or_file("rules_json", "--rules-json"),
+                {"rules_json": [{"effect": "permit", "order": 1}]},
+                ["--rules-json", '[{"effect":"permit","order":1}]'],
+            ),
+            (
+                json_or_file("rules_json", "--rules-json"),
+                {"rules_json": "/no/such/rules.json"},
+                ["--rules-json", "/no/such/rules.json"],
+            ),
+        ],
+    )
+    def test_kind(self, entry, kwargs, expected):
+        assert build_args(("cmd",), kwargs, (entry,)) == ["cmd", *expected]
+
+    def test_inline_json_path_uses_file_flag(self, tmp_path):
+        rules = tmp_path / "rules.json"
+        rules.write_text("[]")
+        spec = (json_or_file("rules_json", "--rules-json"),)
+        assert build_args((), {"rules_json": str(rules)}, spec) == ["--rules-json-file", str(rules)]
+
+    def test_spec_order_is_preserved(self):
+        spec = (("b", "--b", REQUIRED), ("a", "--a", FLAG), (None, "--c", CONST))
+        args = build_args(["x", "y"], {"a": True, "b": "1"}, spec)
+        assert args == ["x", "y", "--b", "1", "--a", "--c"]
+
+
+class TestActionArgv:
+    """Every CTE action still produces the ksctl arguments it always did"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "case", ARGV_CASES, ids=[f"{case['action']}-{case['variant']}" for case in ARGV_CASES]
+    )
+    async def test_action_argv(self, cte_tool, ksctl, case):
+        result = await cte_tool.execute(action=case["action"], **case["params"])
+        if "error" in case:
+            assert ksctl.calls == []
+            assert result["error"] == case["error"]
+        else:
+            assert ksctl.calls == [(case["args"], case["domain"], case["auth_domain"])]
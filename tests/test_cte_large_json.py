@@ -0,0 +1,63 @@
+"""
+Tests for passing oversized inline CTE JSON to ksctl through temporary files
+
+ksctl is replaced by the recording fake from conftest, so no subprocess is run.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ciphertrust_mcp_server.tools.cte_management import base
+
+
+class TestLargeJsonSpill:
+    """Oversized inline JSON reaches ksctl through the matching -file flag"""
+
+    @pytest.mark.asyncio
+    async def test_small_json_stays_inline(self, cte_tool, ksctl):
+        await cte_tool.execute(action="user_set_create", user_json='{"users": []}')
+        assert ksctl.calls[0][0] == ["cte", "user-sets", "create", "--user-json", '{"users": []}']
+
+    @pytest.mark.asyncio
+    async def test_large_json_is_spilled_and_removed(self, cte_tool, ksctl):
+        payload = json.dumps([{"effect": "permit", "action": "all_ops"}] * 2000)
+        await cte_tool.execute(action="policy_create", cte_policy_name="P", policy_type="Standard",
+                               security_rules_json=payload, key_rules_json="[]")
+        args = ksctl.calls[0][0]
+        spilled = args[args.index("--security-rules-json-file") + 1]
+        assert args[-2:] == ["--key-rules-json", "[]"]
+        assert ksctl.files[spilled] == payload
+        assert not Path(spilled).exists()
+
+    @pytest.mark.asyncio
+    async def test_limit_is_measured_in_bytes(self, cte_tool, ksctl):
+        # The same number of characters fits inline as ASCII but not as 3-byte UTF-8
+        ascii_payload = "[" + "a" * (base.SPILL_JSON_BYTES // 2) + "]"
+        cjk_payload = "[" + "漢" * (base.SPILL_JSON_BYTES // 2) + "]"
+        await cte_tool.execute(action="user_set_create", user_json=ascii_payload)
+        await cte_tool.execute(action="user_set_create", user_json=cjk_payload)
+        assert ksctl.calls[0][0][3:] == ["--user-json", ascii_payload]
+        assert ksctl.calls[1][0][3] == "--user-json-file"
+
+    def test_temp_files_removed_when_a_later_spill_fails(self, monkeypatch, cte_tool, ksctl):
+        created = []
+        real_named_temporary_file = tempfile.NamedTemporaryFile
+
+        def failing_second_file(*args, **kwargs):
+            if created:
+                raise OSError("disk full")
+            temp_file = real_named_temporary_file(*args, **kwargs)
+            created.append(temp_file.name)
+            return temp_file
+
+        monkeypatch.setattr(base.tempfile, "NamedTemporaryFile", failing_second_file)
+        big = "[" + "1," * base.SPILL_JSON_BYTES + "1]"
+        args = ["cte", "policies", "create", "--security-rules-json", big, "--key-rules-json", big]
+        with pytest.raises(OSError):
+            cte_tool.sub_tools["policy"].run_command(args, {})
+        assert len(created) == 1
+        assert not Path(created[0]).exists()
+        assert ksctl.calls == []
@@ -0,0 +1,133 @@
+"""
+Tests for the CTE management tool's opt-in read cache
+
+ksctl is replaced by a fake on every sub-tool, so no subprocess is run.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from ciphertrust_mcp_server.config import settings
+from ciphertrust_mcp_server.tools.cte_management.main import CTEManagementTool
+
+
+class FakeKsctl:
+    """Records ksctl calls and answers with the current client state"""
+
+    def __init__(self):
+        self.calls = []
+        self.state = "old"
+        self.block = {}  # ksctl subcommand -> (started, release) events
+
+    def __call__(self, args, domain=None, auth_domain=None):
+        args = list(args)
+        self.calls.append(args)
+        subcommand = args[2]
+        if subcommand in self.block:
+            started, release = self.block[subcommand]
+            started.set()
+            release.wait(5)
+        if subcommand == "modify":
+            self.state = "new"
+            return {"data": {"modified": True}}
+        return {"data": {"state": self.state}}
+
+    def hold(self, subcommand):
+        """Make calls to a subcommand wait until the returned release event is set"""
+        started, release = threading.Event(), threading.Event()
+        self.block[subcommand] = (started, release)
+        return started, release
+
+
+@pytest.fixture
+def fake_ksctl():
+    return FakeKsctl()
+
+
+@pytest.fixture
+def tool(fake_ksctl, monkeypatch):
+    monkeypatch.setattr(settings, "ciphertrust_read_cache_ttl", 30)
+    cte = CTEManagementTool()
+    for sub_tool in cte.sub_tools.values():
+        sub_tool.execute_with_domain = fake_ksctl
+    return cte
+
+
+def client_get(cte, **kwargs):
+    return cte.execute(action="client_get", cte_client_identifier="C1", **kwargs)
+
+
+def client_modify(cte):
+    return cte.execute(action="client_modify", cte_client_identifier="C1", comm_enabled=True)
+
+
+class TestReadCache:
+    """Caching of get/list results and their invalidation"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_read_is_served_from_cache(self, tool, fake_ksctl):
+        assert await client_get(tool) == {"state": "old"}
+        assert await client_get(tool) == {"state": "old"}
+        assert len(fake_ksctl.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_different_params_are_cached_separately(self, tool, fake_ksctl):
+        await client_get(tool)
+        await client_get(tool, domain="other")
+        assert len(fake_ksctl.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_by_default(self, tool, fake_ksctl, monkeypatch):
+        monkeypatch.setattr(settings, "ciphertrust_read_cache_ttl", 0)
+        await client_get(tool)
+        await client_get(tool)
+        assert len(fake_ksctl.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self, tool, fake_ksctl):
+        await client_get(tool)
+        tool._read_cache = {key: (0.0, value) for key, (_, value) in tool._read_cache.items()}
+        await client_get(tool)
+        assert len(fake_ksctl.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_cached_reads(self, tool, fake_ksctl):
+        assert await client_get(tool) == {"state": "old"}
+        await client_modify(tool)
+        assert await client_get(tool) == {"state": "new"}
+        assert len(fake_ksctl.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_unhashable_params_bypass_cache(self, tool, fake_ksctl):
+        assert await client_get(tool, tags=["a"]) == {"state": "old"}
+        await client_get(tool, tags=["a"])
+        assert len(fake_ksctl.calls) == 2
+        assert tool._read_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_read_during_write_does_not_outlive_it(self, tool, fake_ksctl):
+        started, release = fake_ksctl.hold("modify")
+        write = asyncio.create_task(client_modify(tool))
+        await asyncio.to_thread(started.wait, 5)
+
+        assert await client_get(tool) == {"state": "old"}
+        release.set()
+        await write
+
+        assert await client_get(tool) == {"state": "new"}
+
+    @pytest.mark.asyncio
+    async def test_read_finishing_after_write_is_not_stored(self, tool, fake_ksctl):
+        started, release = fake_ksctl.hold("get")
+        read = asyncio.create_task(client_get(tool))
+        await asyncio.to_thread(started.wait, 5)
+
+        await client_modify(tool)
+        release.set()
+        await read
+
+        del fake_ksctl.block["get"]
+        assert await client_get(tool) == {"state": "new"}
+        assert len(fake_ksctl.calls) == 3